@@ -94,7 +94,8 @@ async function loadRecommendedJobs() {
     }
 
     try {
-        const response = await fetch(`${BASE_PATH}/api/recommended-jobs`);
+        // fields=list skips descriptions; they are loaded per job from /api/job
+        const response = await fetch(`${BASE_PATH}/api/recommended-jobs?fields=list`);
 
         const data = await response.json();
 
@@ -139,7 +140,7 @@ async function searchJobs() {
         const response = await fetch(`${BASE_PATH}/api/search`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ query, location, source })
+            body: JSON.stringify({ query, location, source, fields: 'list' })
         });
 
         const data = await response.json();
@@ -209,13 +210,43 @@ function createJobCard(job, index) {
         <div class="job-description">${escapeHtml(job.description)}</div>
 
         <div class="job-actions">
+            ${!job.description && job.id ? '<button type="button" class="description-btn">Show Description</button>' : ''}
             <a href="${escapeHtml(job.apply_link)}" target="_blank" class="apply-btn">Apply Now</a>
         </div>
     `;
 
+    const descriptionBtn = card.querySelector('.description-btn');
+    if (descriptionBtn) {
+        descriptionBtn.addEventListener('click', () => loadJobDescription(job, card, descriptionBtn));
+    }
+
     return card;
 }
 
+// Load the full description for a job card on demand
+async function loadJobDescription(job, card, button) {
+    button.disabled = true;
+    button.textContent = 'Loading...';
+
+    try {
+        const response = await fetch(`${BASE_PATH}/api/job?id=${encodeURIComponent(job.id)}`);
+        const data = await response.json();
+
+        if (data.success) {
+            // Kept on the job so re-rendering after sort/filter shows it again
+            job.description = data.job.description;
+            card.querySelector('.job-description').textContent = job.description;
+            button.remove();
+        } else {
+            button.textContent = 'Description unavailable';
+        }
+    } catch (error) {
+        console.error('Error loading job description:', error);
+        button.disabled = false;
+        button.textContent = 'Show Description';
+    }
+}
+
 // Format date
 function formatDate(dateString) {
     if (!dateString || dateString === 'N/A') return 'Recently';
@@ -12,6 +12,9 @@ import hashlib
 import hmac
 import secrets
 import re
+import sys
+import zlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import requests
 import mimetypes
@@ -27,6 +30,12 @@ JSEARCH_API_KEY = "b67870aca3msh83fd55e7e7d4f38p1549d2jsn7576024d3977"
 JSEARCH_HOST = "jsearch.p.rapidapi.com"
 ARBEITNOW_API_URL = "https://www.arbeitnow.com/api/job-board-api"
 
+# Job cache (serves /api/job detail lookups)
+JOB_CACHE_SIZE = 500
+# How long recommended jobs are reused before Arbeitnow is queried again
+RECOMMENDED_CACHE_TTL = timedelta(minutes=10)
+RECOMMENDED_CACHE_SIZE = 100
+
 # Ensure data directory exists
 os.makedirs(DATA_DIR, exist_ok=True)
 
@@ -106,6 +115,125 @@ def get_user_from_session(session_token):
             return user
     return None
 
+# Job records
+
+
+def intern_string(value):
+    # Upstream values aren't guaranteed to be strings; pass others through
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Job:
+    # Slots instead of a per-posting dict; repeated strings are interned and
+    # the full description is kept zlib-compressed until it is requested
+    __slots__ = ('id', 'title', 'company', 'location', 'compressed_description',
+                 'salary', 'employment_type', 'posted_date', 'apply_link', 'source')
+
+    FIELDS = ('id', 'title', 'company', 'location', 'description', 'salary',
+              'employment_type', 'posted_date', 'apply_link', 'source')
+    LIST_FIELDS = tuple(f for f in FIELDS if f != 'description')
+    PREVIEW_LENGTH = 300
+
+    def __init__(self, id, title, company, location, description, salary,
+                 employment_type, posted_date, apply_link, source):
+        self.id = id
+        self.title = title
+        self.company = intern_string(company)
+        self.location = intern_string(location)
+        self.compressed_description = zlib.compress(
+            str(description).encode('utf-8'))
+        self.salary = salary
+        self.employment_type = intern_string(employment_type)
+        self.posted_date = posted_date
+        self.apply_link = apply_link
+        self.source = intern_string(source)
+
+    @property
+    def description(self):
+        return zlib.decompress(self.compressed_description).decode('utf-8')
+
+    @property
+    def preview(self):
+        # Only inflate enough bytes to cover PREVIEW_LENGTH characters
+        head = zlib.decompressobj().decompress(
+            self.compressed_description, self.PREVIEW_LENGTH * 4 + 3)
+        return head.decode('utf-8', 'ignore')[:self.PREVIEW_LENGTH] + '...'
+
+    def to_dict(self, fields=None, full=False):
+        # Lists get a preview; the full description is only sent when asked
+        data = {}
+        for f in fields or self.FIELDS:
+            if f == 'description':
+                data[f] = self.description if full else self.preview
+            else:
+                data[f] = getattr(self, f)
+        return data
+
+
+job_cache = OrderedDict()
+# user id -> (preferences, fetched_at, job ids); the jobs live in job_cache
+recommended_cache = OrderedDict()
+
+
+def cache_jobs(jobs):
+    for job in jobs:
+        if not job.id:
+            continue
+        job_cache[job.id] = job
+        job_cache.move_to_end(job.id)
+    while len(job_cache) > JOB_CACHE_SIZE:
+        job_cache.popitem(last=False)
+    return jobs
+
+
+def cache_recommended(user_id, preferences, jobs):
+    # Jobs without an id can't be looked up in job_cache again
+    if not jobs or not all(job.id for job in jobs):
+        return
+    now = datetime.now()
+    for key in [k for k, entry in recommended_cache.items()
+                if now - entry[1] >= RECOMMENDED_CACHE_TTL]:
+        del recommended_cache[key]
+    recommended_cache[user_id] = (
+        preferences, now, tuple(job.id for job in jobs))
+    recommended_cache.move_to_end(user_id)
+    while len(recommended_cache) > RECOMMENDED_CACHE_SIZE:
+        recommended_cache.popitem(last=False)
+
+
+def get_recommended(user_id, preferences):
+    entry = recommended_cache.get(user_id)
+    if not entry:
+        return None
+    if datetime.now() - entry[1] >= RECOMMENDED_CACHE_TTL:
+        del recommended_cache[user_id]
+        return None
+    if entry[0] != preferences:
+        return None
+    jobs = [job_cache.get(job_id) for job_id in entry[2]]
+    # Any job evicted from job_cache means the list has to be refetched
+    if not all(jobs):
+        return None
+    return jobs
+
+
+def parse_fields(value):
+    # Accepts "a,b" or ["a", "b"]; "list" means every field but description.
+    # Unknown names and other types are ignored
+    if isinstance(value, str):
+        value = value.split(',')
+    if not isinstance(value, list):
+        return None
+    names = [f.strip() for f in value if isinstance(f, str)]
+    if names == ['list']:
+        return Job.LIST_FIELDS
+    fields = tuple(f for f in names if f in Job.FIELDS)
+    return fields or None
+
+
+def jobs_to_dicts(jobs, fields=None):
+    return [job.to_dict(fields) for job in jobs]
+
 # API Functions
 
 
@@ -140,19 +268,20 @@ def fetch_jsearch_jobs(query, location=""):
 
         if 'data' in data:
             for job in data['data']:
-                jobs.append({
-                    'id': job.get('job_id', ''),
-                    'title': job.get('job_title', 'N/A'),
-                    'company': job.get('employer_name', 'N/A'),
-                    'location': job.get('job_city', job.get('job_country', 'Remote')),
-                    'description': (job.get('job_description', 'No description')[:300] + '...'),
-                    'salary': job.get('job_salary', 'Not specified'),
-                    'employment_type': job.get('job_employment_type', 'N/A'),
-                    'posted_date': job.get('job_posted_at_datetime_utc', 'N/A'),
-                    'apply_link': job.get('job_apply_link', '#'),
-                    'source': 'JSearch'
-                })
-        return jobs
+                jobs.append(Job(
+                    id=job.get('job_id') or '',
+                    title=job.get('job_title') or 'N/A',
+                    company=job.get('employer_name') or 'N/A',
+                    location=job.get('job_city') or job.get(
+                        'job_country') or 'Remote',
+                    description=job.get('job_description') or 'No description',
+                    salary=job.get('job_salary') or 'Not specified',
+                    employment_type=job.get('job_employment_type') or 'N/A',
+                    posted_date=job.get('job_posted_at_datetime_utc') or 'N/A',
+                    apply_link=job.get('job_apply_link') or '#',
+                    source='JSearch'
+                ))
+        return cache_jobs(jobs)
     except Exception as e:
         print(f"JSearch error: {e}")
         return []
@@ -175,19 +304,20 @@ def fetch_arbeitnow_jobs(query="", location=""):
                 if location and location.lower() not in job_location:
                     continue
 
-                jobs.append({
-                    'id': job.get('slug', ''),
-                    'title': job.get('title', 'N/A'),
-                    'company': job.get('company_name', 'N/A'),
-                    'location': job.get('location', 'Remote'),
-                    'description': (job.get('description', 'No description')[:300] + '...'),
-                    'salary': 'Not specified',
-                    'employment_type': job.get('job_types', ['N/A'])[0] if job.get('job_types') else 'N/A',
-                    'posted_date': job.get('created_at', 'N/A'),
-                    'apply_link': job.get('url', '#'),
-                    'source': 'Arbeitnow'
-                })
-        return jobs
+                jobs.append(Job(
+                    id=job.get('slug') or '',
+                    title=job.get('title') or 'N/A',
+                    company=job.get('company_name') or 'N/A',
+                    location=job.get('location') or 'Remote',
+                    description=job.get('description') or 'No description',
+                    salary='Not specified',
+                    employment_type=job['job_types'][0] if job.get(
+                        'job_types') else 'N/A',
+                    posted_date=job.get('created_at') or 'N/A',
+                    apply_link=job.get('url') or '#',
+                    source='Arbeitnow'
+                ))
+        return cache_jobs(jobs)
     except Exception as e:
         print(f"Arbeitnow error: {e}")
         return []
@@ -217,6 +347,8 @@ class JobSphereHandler(BaseHTTPRequestHandler):
             self.get_stats()
         elif path == '/api/recommended-jobs':
             self.handle_recommended_jobs()
+        elif path == '/api/job':
+            self.handle_job_detail()
         else:
             self.send_error(404)
 
@@ -281,11 +413,42 @@ class JobSphereHandler(BaseHTTPRequestHandler):
         with open(filepath, 'rb') as f:
             self.wfile.write(f.read())
 
-    def send_json(self, data, status=200):
+    def send_json(self, data, status=200, etag=False):
+        body = json.dumps(data, separators=(',', ':')).encode()
+
+        if etag:
+            tag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            if self.etag_matches(tag):
+                self.send_response(304)
+                self.send_header('ETag', tag)
+                self.send_header('Cache-Control', 'private, no-cache')
+                self.end_headers()
+                return
+
         self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', tag)
+            self.send_header('Cache-Control', 'private, no-cache')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
+
+    def etag_matches(self, tag):
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        for candidate in header.split(','):
+            candidate = candidate.strip()
+            if candidate.startswith('W/'):
+                candidate = candidate[2:]
+            if candidate == '*' or candidate == tag:
+                return True
+        return False
+
+    def get_query_param(self, name, default=''):
+        params = parse_qs(urlparse(self.path).query)
+        return params.get(name, [default])[0]
 
     def get_session_token(self):
         cookie = self.headers.get('Cookie')
@@ -330,10 +493,10 @@ class JobSphereHandler(BaseHTTPRequestHandler):
                     'dark_mode': user.get('dark_mode', False),
                     'notifications_enabled': user.get('notifications_enabled', True)
                 }
-            })
+            }, etag=True)
         else:
             print("No valid session found")
-            self.send_json({'authenticated': False})
+            self.send_json({'authenticated': False}, etag=True)
 
     def handle_signup(self, data):
         username = data.get('username', '').strip()
@@ -531,6 +694,8 @@ class JobSphereHandler(BaseHTTPRequestHandler):
         query = data.get('query', '')
         location = data.get('location', '')
         source = data.get('source', 'all')
+        fields = parse_fields(data.get('fields')
+                              or self.get_query_param('fields'))
 
         jobs = []
 
@@ -544,7 +709,7 @@ class JobSphereHandler(BaseHTTPRequestHandler):
 
         self.send_json({
             'success': True,
-            'jobs': jobs,
+            'jobs': jobs_to_dicts(jobs, fields),
             'total_results': len(jobs)
         })
 
@@ -623,7 +788,18 @@ class JobSphereHandler(BaseHTTPRequestHandler):
 
         if not titles:
             self.send_json({'success': True, 'jobs': [],
-                           'message': 'Set preferences first'})
+                           'message': 'Set preferences first'}, etag=True)
+            return
+
+        fields = parse_fields(self.get_query_param('fields'))
+        preferences = (tuple(titles[:2]), tuple(locations[:1]))
+
+        # Repeat polls reuse the last result so an unchanged list gets a 304
+        # without hitting Arbeitnow again
+        cached = get_recommended(user['id'], preferences)
+        if cached:
+            self.send_json(
+                {'success': True, 'jobs': jobs_to_dicts(cached, fields)}, etag=True)
             return
 
         all_jobs = []
@@ -636,12 +812,36 @@ class JobSphereHandler(BaseHTTPRequestHandler):
         seen = set()
         unique_jobs = []
         for job in all_jobs:
-            key = (job['title'], job['company'])
+            key = (job.title, job.company)
             if key not in seen:
                 seen.add(key)
                 unique_jobs.append(job)
+        unique_jobs = unique_jobs[:10]
+
+        # Failed or empty fetches are not cached so the next poll retries
+        cache_recommended(user['id'], preferences, unique_jobs)
 
-        self.send_json({'success': True, 'jobs': unique_jobs[:10]})
+        self.send_json(
+            {'success': True, 'jobs': jobs_to_dicts(unique_jobs, fields)}, etag=True)
+
+    def handle_job_detail(self):
+        token = self.get_session_token()
+        user = get_user_from_session(token)
+
+        if not user:
+            self.send_json(
+                {'success': False, 'message': 'Not authenticated'}, 401)
+            return
+
+        job_id = self.get_query_param('id')
+        job = job_cache.get(job_id) if job_id else None
+        if not job:
+            self.send_json(
+                {'success': False, 'message': 'Job not found'}, 404)
+            return
+
+        self.send_json(
+            {'success': True, 'job': job.to_dict(full=True)}, etag=True)
 
     def get_stats(self):
         counter = load_json('api_counter.json')
@@ -649,7 +849,7 @@ class JobSphereHandler(BaseHTTPRequestHandler):
             'used': counter['count'],
             'remaining': 200 - counter['count'],
             'total': 200
-        })
+        }, etag=True)
 
     def log_message(self, format, *args):
         # Custom logging